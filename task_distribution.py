@@ -1,26 +1,184 @@
 import json
+import numpy as np
 import pandas as pd
 import os
 import math
+import re
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-def jsonl_to_csv(jsonl_file_path, csv_file_path):
-    """Convert JSONL file to CSV format"""
-    print(f"Converting {jsonl_file_path} to CSV...")
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.json as pa_json
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+# Block size used by the Arrow JSON reader when chunking the input file
+ARROW_JSON_BLOCK_SIZE = 64 << 20
+
+# Floats at or beyond this magnitude may be integers that overflowed int64 in Arrow
+ARROW_INT64_LIMIT = 2 ** 63
+
+# Whole-number floats up to this magnitude are exact in float64 and written as integers
+FLOAT_EXACT_INT_LIMIT = 2 ** 53
+
+# Rows per record batch when writing CSV files with Arrow
+ARROW_CSV_BATCH_SIZE = 65536
+
+# Read buffer for the line-by-line JSONL parser
+JSONL_READ_BUFFER_SIZE = 4 << 20
+
+# Integer literals of 19+ digits may fall outside int64/uint64 (e.g. below -2**63),
+# which orjson reads as rounded floats; such lines are parsed with the json module
+LONG_INTEGER_PATTERN = re.compile(rb'\d{19}')
+
+# Rows parsed into Python dicts before being packed into a DataFrame chunk
+JSONL_CHUNK_SIZE = 100_000
+
+def arrow_types_match_json(table):
+    """Check that Arrow inferred only types the json module would produce for the same values"""
+    for field in table.schema:
+        field_type = field.type
+        if pa.types.is_floating(field_type):
+            # Integers wider than 64 bits are silently read as (rounded) doubles
+            max_abs = pc.max(pc.abs(table.column(field.name))).as_py()
+            if max_abs is not None and max_abs >= ARROW_INT64_LIMIT:
+                return False
+        elif not (pa.types.is_null(field_type) or pa.types.is_boolean(field_type)
+                  or pa.types.is_int64(field_type) or pa.types.is_string(field_type)):
+            # Lists/structs don't round-trip to CSV (timestamps are re-read as strings first)
+            return False
+    return True
+
+def read_jsonl_arrow(jsonl_file_path):
+    """Parse JSONL file into an Arrow table, or return None if Arrow can't handle it"""
+    if pa is None:
+        return None
+    
+    try:
+        read_options = pa_json.ReadOptions(block_size=ARROW_JSON_BLOCK_SIZE)
+        table = pa_json.read_json(jsonl_file_path, read_options=read_options)
+        
+        # Date-like strings are inferred as timestamps; read those fields again as plain strings
+        timestamp_fields = [field.name for field in table.schema if pa.types.is_timestamp(field.type)]
+        if timestamp_fields:
+            column_order = table.schema.names
+            explicit_schema = pa.schema([(name, pa.string()) for name in timestamp_fields])
+            parse_options = pa_json.ParseOptions(explicit_schema=explicit_schema)
+            table = pa_json.read_json(jsonl_file_path, read_options=read_options, parse_options=parse_options)
+            # Explicit fields come first in the result; restore the input column order
+            table = table.select(column_order)
+    except pa.ArrowException as e:
+        print(f"Arrow JSON reader failed ({e}), falling back to line-by-line parsing")
+        return None
+    
+    if not arrow_types_match_json(table):
+        print("Arrow JSON reader changed value types, falling back to line-by-line parsing")
+        return None
+    return table
+
+def whole_floats_as_int64(column):
+    """Cast a float column to int64 if every non-null value is a whole number within ±2**53"""
+    # NaN and infinities fail one of the checks, so those columns stay float
+    is_whole = pc.equal(pc.floor(column), column)
+    is_exact = pc.less_equal(pc.abs(column), FLOAT_EXACT_INT_LIMIT)
+    if pc.all(pc.and_(is_whole, is_exact)).as_py() is True:
+        return column.cast(pa.int64())
+    return column
+
+def write_arrow_csv(table, csv_file_path):
+    """Write Arrow table to CSV, spelling booleans True/False like pandas does"""
+    columns = []
+    for column in table.columns:
+        if pa.types.is_boolean(column.type):
+            column = pc.if_else(column, 'True', 'False')
+        elif pa.types.is_floating(column.type):
+            # pandas writes NaN as an empty field; Arrow would write "nan"
+            column = pc.if_else(pc.is_nan(column), pa.scalar(None, column.type), column)
+            # Arrow prints large floats in exponent form (1.7e+12); keep IDs and
+            # timestamps that became float only because of missing values readable
+            column = whole_floats_as_int64(column)
+        columns.append(column)
+    table = pa.Table.from_arrays(columns, names=table.column_names)
+    write_options = pa_csv.WriteOptions(batch_size=ARROW_CSV_BATCH_SIZE)
+    pa_csv.write_csv(table, csv_file_path, write_options=write_options)
+
+def save_dataframe_csv(df, csv_file_path):
+    """Write DataFrame to CSV with Arrow's C++ writer when available, otherwise with pandas"""
+    # A frame without columns goes to pandas, which writes an empty line rather than an empty file
+    if pa is not None and len(df.columns) > 0:
+        try:
+            write_arrow_csv(pa.Table.from_pandas(df, preserve_index=False), csv_file_path)
+            return
+        except (pa.ArrowException, OverflowError):
+            # Mixed-type, nested or too-wide integer columns; let pandas handle them
+            pass
     
+    df.to_csv(csv_file_path, index=False)
+
+def parse_json_line(line):
+    """Parse one JSONL line with orjson when available, falling back to the json module"""
+    if orjson is not None and LONG_INTEGER_PATTERN.search(line) is None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which json accepts (and json.dumps writes)
+            pass
+    return json.loads(line)
+
+def read_jsonl_chunks(jsonl_file_path, chunk_size=JSONL_CHUNK_SIZE):
+    """Yield DataFrames of up to chunk_size rows parsed line by line, skipping invalid lines"""
     data = []
-    with open(jsonl_file_path, 'r', encoding='utf-8') as file:
+    chunks_yielded = 0
+    # Binary mode: both json parsers accept UTF-8 bytes, so lines skip text decoding
+    with open(jsonl_file_path, 'rb', buffering=JSONL_READ_BUFFER_SIZE) as file:
         for line in file:
             try:
-                json_obj = json.loads(line.strip())
+                json_obj = parse_json_line(line)
                 data.append(json_obj)
             except json.JSONDecodeError as e:
                 print(f"Error parsing line: {e}")
                 continue
+            
+            if len(data) >= chunk_size:
+                yield pd.DataFrame(data)
+                chunks_yielded += 1
+                data = []
+    
+    # Yield at least one chunk so an empty file still produces a DataFrame
+    if data or chunks_yielded == 0:
+        yield pd.DataFrame(data)
+
+def jsonl_to_csv(jsonl_file_path, csv_file_path):
+    """Convert JSONL file to CSV format"""
+    print(f"Converting {jsonl_file_path} to CSV...")
     
-    df = pd.DataFrame(data)
-    df.to_csv(csv_file_path, index=False)
+    # Fast path: parse and write with Arrow without building Python objects per row
+    table = read_jsonl_arrow(jsonl_file_path)
+    if table is not None:
+        write_arrow_csv(table, csv_file_path)
+        df = table.to_pandas()
+        print(f"Complete CSV file created: {csv_file_path}")
+        return df
+    
+    df = pd.concat(read_jsonl_chunks(jsonl_file_path), ignore_index=True)
+    save_dataframe_csv(df, csv_file_path)
     print(f"Complete CSV file created: {csv_file_path}")
     return df
 
@@ -32,11 +190,14 @@ def sort_by_repo_name_and_add_serial(df):
         print("Warning: 'repo_name' column not found. Available columns:", df.columns.tolist())
         return df
     
-    # Sort by repo_name
-    sorted_df = df.sort_values('repo_name').reset_index(drop=True)
+    # Store repo_name as a categorical so sorting and run detection compare integer codes
+    df = df.assign(repo_name=df['repo_name'].astype('category'))
+    
+    # Sort by repo_name (stable, so tasks keep their input order within a repo)
+    sorted_df = df.sort_values('repo_name', kind='stable', ignore_index=True)
     
     # Add serial number column at the beginning
-    sorted_df.insert(0, 'serial_no', range(1, len(sorted_df) + 1))
+    sorted_df.insert(0, 'serial_no', np.arange(1, len(sorted_df) + 1, dtype=np.int64))
     
     print(f"Data sorted and serial numbers added. Total rows: {len(sorted_df)}")
     return sorted_df
@@ -98,72 +259,104 @@ def create_capacity_based_batches(df, teams_info):
     
     return batches
 
-def distribute_tasks_by_capacity_with_serial_sequence(batch_df, teams_info):
-    """Distribute batch data among teams based on capacity while maintaining serial number sequence"""
-    print(f"Distributing {len(batch_df)} tasks among teams based on capacity...")
-    
-    # Group by repo_name to keep repositories together
-    repo_groups = batch_df.groupby('repo_name')
-    repo_list = []
-    
-    for repo_name, group in repo_groups:
-        repo_list.append({
-            'repo_name': repo_name,
-            'tasks': group.sort_values('serial_no'),  # Keep serial order within repo
-            'task_count': len(group)
-        })
-    
-    # Sort repositories by their minimum serial number to maintain overall sequence
-    repo_list.sort(key=lambda x: x['tasks']['serial_no'].min())
-    
-    # Initialize teams with their capacity info
-    teams = []
-    for team_info in teams_info:
-        teams.append({
-            'team_info': team_info,
-            'tasks': pd.DataFrame(),
-            'assigned_tasks': 0,
-            'remaining_capacity': team_info['weekly_capacity'],
-            'serial_range': {'min': None, 'max': None}
-        })
-    
-    # Distribute repositories to teams based on capacity while maintaining sequence
-    current_team_idx = 0
-    
-    for repo_info in repo_list:
-        # Check if current team can handle this repo
-        if teams[current_team_idx]['remaining_capacity'] >= repo_info['task_count']:
-            # Assign to current team
-            target_team = current_team_idx
-        else:
+def get_repo_boundaries(repo_names):
+    """Return start and end row positions of each run of equal repo names (or codes) in a sorted array"""
+    if len(repo_names) == 0:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    
+    changes = np.flatnonzero(repo_names[1:] != repo_names[:-1]) + 1
+    starts = np.concatenate(([0], changes))
+    ends = np.concatenate((changes, [len(repo_names)]))
+    return starts, ends
+
+@njit(cache=True)
+def assign_repos_to_teams(repo_counts, capacities):
+    """Return the team index for each repository, filling teams in sequence by capacity"""
+    repo_to_team = np.empty(len(repo_counts), dtype=np.int64)
+    remaining = capacities.copy()
+    current_team = 0
+    
+    for r in range(len(repo_counts)):
+        count = repo_counts[r]
+        target_team = current_team
+        
+        if remaining[current_team] < count:
             # Find next team with sufficient capacity
             found_team = False
-            for i in range(current_team_idx + 1, len(teams)):
-                if teams[i]['remaining_capacity'] >= repo_info['task_count']:
+            for i in range(current_team + 1, len(remaining)):
+                if remaining[i] >= count:
                     target_team = i
-                    current_team_idx = i
+                    current_team = i
                     found_team = True
                     break
             
             if not found_team:
                 # If no team can handle the repo completely, assign to team with most remaining capacity
-                target_team = max(range(len(teams)), key=lambda i: teams[i]['remaining_capacity'])
-        
-        # Assign repository to the selected team
-        if teams[target_team]['tasks'].empty:
-            teams[target_team]['tasks'] = repo_info['tasks'].copy()
-            teams[target_team]['serial_range']['min'] = repo_info['tasks']['serial_no'].min()
-        else:
-            teams[target_team]['tasks'] = pd.concat([teams[target_team]['tasks'], repo_info['tasks']], ignore_index=True)
+                target_team = np.argmax(remaining)
         
-        teams[target_team]['serial_range']['max'] = repo_info['tasks']['serial_no'].max()
-        teams[target_team]['assigned_tasks'] += repo_info['task_count']
-        teams[target_team]['remaining_capacity'] -= repo_info['task_count']
+        repo_to_team[r] = target_team
+        remaining[target_team] -= count
+    
+    return repo_to_team
+
+def distribute_tasks_by_capacity_with_serial_sequence(batch_df, teams_info):
+    """Distribute batch data among teams based on capacity while maintaining serial number sequence"""
+    print(f"Distributing {len(batch_df)} tasks among teams based on capacity...")
     
-    # Sort tasks within each team by serial number to maintain sequence
-    for team in teams:
-        if not team['tasks'].empty:
-            team['tasks'] = team['tasks'].sort_values('serial_no').reset_index(drop=True)
+    # The batch must be sorted by repo_name and serial_no (as produced by
+    # sort_by_repo_name_and_add_serial), so each repository is a contiguous run of rows
+    # already in serial order, and the runs themselves are in ascending serial order.
+    # repo_name is normally categorical already; other dtypes are converted here.
+    repo_column = batch_df['repo_name']
+    if not isinstance(repo_column.dtype, pd.CategoricalDtype):
+        repo_column = repo_column.astype('category')
+    repo_codes = repo_column.cat.codes.to_numpy()
+    starts, ends = get_repo_boundaries(repo_codes)
+    repo_counts = (ends - starts).astype(np.int64)
+    run_codes = repo_codes[starts]
+    serial_nos = batch_df['serial_no'].to_numpy()
+    
+    # Decide which team each repository goes to, then expand to one team index per row.
+    # Rows without a repo_name (code -1) are left unassigned, as groupby('repo_name') did.
+    capacities = np.array([team_info['weekly_capacity'] for team_info in teams_info], dtype=np.int64)
+    named_runs = run_codes >= 0
+    repo_to_team = np.full(len(repo_counts), -1, dtype=np.int64)
+    repo_to_team[named_runs] = assign_repos_to_teams(repo_counts[named_runs], capacities)
+    row_to_team = np.repeat(repo_to_team, repo_counts)
+    
+    # Build each team's tasks with a single gather of its row positions. Team statistics
+    # come straight from the per-repository arrays, so the rows are not scanned again.
+    teams = []
+    for team_idx, team_info in enumerate(teams_info):
+        team_repos = np.flatnonzero(repo_to_team == team_idx)
+        assigned_tasks = int(repo_counts[team_repos].sum())
+        
+        # Repository distribution in name order; unnamed runs are never assigned, so
+        # every code here indexes a real category
+        repo_names = repo_column.cat.categories[run_codes[team_repos]]
+        repo_distribution = dict(zip(repo_names.tolist(), repo_counts[team_repos].tolist()))
+        
+        tasks = pd.DataFrame()
+        serial_range = {'min': None, 'max': None}
+        if len(team_repos) > 0:
+            # Repositories are assigned in ascending serial order and each is already
+            # sorted, so the gathered rows are in serial order without re-sorting
+            row_idx = np.flatnonzero(row_to_team == team_idx)
+            tasks = batch_df.take(row_idx).reset_index(drop=True)
+            assert tasks['serial_no'].is_monotonic_increasing
+            serial_range = {
+                'min': int(serial_nos[starts[team_repos[0]]]),
+                'max': int(serial_nos[ends[team_repos[-1]] - 1])
+            }
+        
+        teams.append({
+            'team_info': team_info,
+            'tasks': tasks,
+            'assigned_tasks': assigned_tasks,
+            'remaining_capacity': team_info['weekly_capacity'] - assigned_tasks,
+            'serial_range': serial_range,
+            'repo_distribution': repo_distribution
+        })
     
     return teams
 
@@ -171,8 +364,13 @@ def create_folder_structure_and_save(batches, teams_info, base_output_dir="task_
     """Create folder structure and save team files"""
     print(f"Creating folder structure in '{base_output_dir}'...")
     
-    # Create base directory
-    Path(base_output_dir).mkdir(exist_ok=True)
+    # Create base directory and all week folders up front
+    base_path = Path(base_output_dir)
+    base_path.mkdir(exist_ok=True)
+    
+    week_folders = [base_path / f"week_{week_num}" for week_num in range(1, len(batches) + 1)]
+    for week_folder in week_folders:
+        week_folder.mkdir(exist_ok=True)
     
     distribution_report = {
         'total_tasks': sum(len(batch) for batch in batches),
@@ -181,68 +379,188 @@ def create_folder_structure_and_save(batches, teams_info, base_output_dir="task_
         'weekly_distributions': []
     }
     
-    for week_num, batch_df in enumerate(batches, 1):
-        week_folder = Path(base_output_dir) / f"week_{week_num}"
-        week_folder.mkdir(exist_ok=True)
-        
-        print(f"\nProcessing Week {week_num} ({len(batch_df)} tasks)...")
-        
-        # Distribute batch among teams based on capacity while maintaining serial sequence
-        teams = distribute_tasks_by_capacity_with_serial_sequence(batch_df, teams_info)
-        
-        week_distribution = {
-            'week': week_num,
-            'total_tasks': len(batch_df),
-            'serial_range': {'min': batch_df['serial_no'].min(), 'max': batch_df['serial_no'].max()},
-            'teams': []
-        }
-        
-        # Save team files and collect statistics
-        for team_data in teams:
-            team_info = team_data['team_info']
-            team_num = team_info['team_number']
+    # File-safe lead names for team file names, computed once per team
+    safe_lead_names = {team['team_number']: team['lead_name'].replace(' ', '_') for team in teams_info}
+    
+    # Team files of a week are written in parallel; waiting for them before the next
+    # week keeps only one week of team frames alive at a time
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for week_num, (week_folder, batch_df) in enumerate(zip(week_folders, batches), 1):
+            print(f"\nProcessing Week {week_num} ({len(batch_df)} tasks)...")
             
-            team_file = week_folder / f"team_{team_num}_{team_info['lead_name'].replace(' ', '_')}.csv"
-            team_data['tasks'].to_csv(team_file, index=False)
+            # Distribute batch among teams based on capacity while maintaining serial sequence
+            teams = distribute_tasks_by_capacity_with_serial_sequence(batch_df, teams_info)
             
-            # Calculate work distribution per developer
-            tasks_per_dev = team_data['assigned_tasks'] / team_info['num_developers'] if team_info['num_developers'] > 0 else 0
-            days_needed = math.ceil(tasks_per_dev / 5) if tasks_per_dev > 0 else 0
+            week_distribution = {
+                'week': week_num,
+                'total_tasks': len(batch_df),
+                'serial_range': {'min': int(batch_df['serial_no'].iat[0]), 'max': int(batch_df['serial_no'].iat[-1])},
+                'teams': []
+            }
             
-            # Get serial number range for this team
-            serial_range = team_data['serial_range']
-            serial_range_str = f"{serial_range['min']}-{serial_range['max']}" if serial_range['min'] is not None else "No tasks"
+            # Save team files
+            team_files = []
+            write_futures = []
+            for team_data in teams:
+                team_info = team_data['team_info']
+                team_file = week_folder / f"team_{team_info['team_number']}_{safe_lead_names[team_info['team_number']]}.csv"
+                team_files.append(team_file)
+                write_futures.append(executor.submit(save_dataframe_csv, team_data['tasks'], team_file))
             
-            print(f"  Team {team_num} ({team_info['lead_name']}): {team_data['assigned_tasks']} tasks -> {team_file}")
-            print(f"    Serial Range: {serial_range_str}")
-            print(f"    Capacity: {team_info['weekly_capacity']}, Used: {team_data['assigned_tasks']}, Remaining: {team_data['remaining_capacity']}")
-            print(f"    Tasks per developer: {tasks_per_dev:.1f}, Days needed: {days_needed}")
+            for future in write_futures:
+                # result() re-raises any exception from the write
+                future.result()
             
-            # Repository distribution
-            repo_counts = {}
-            if not team_data['tasks'].empty:
-                repo_counts = team_data['tasks']['repo_name'].value_counts()
-                print(f"    Repositories: {len(repo_counts)} repos")
+            # Collect statistics
+            for team_data, team_file in zip(teams, team_files):
+                team_info = team_data['team_info']
+                team_num = team_info['team_number']
+                
+                # Calculate work distribution per developer
+                tasks_per_dev = team_data['assigned_tasks'] / team_info['num_developers'] if team_info['num_developers'] > 0 else 0
+                days_needed = math.ceil(tasks_per_dev / 5) if tasks_per_dev > 0 else 0
+                
+                # Get serial number range for this team
+                serial_range = team_data['serial_range']
+                serial_range_str = f"{serial_range['min']}-{serial_range['max']}" if serial_range['min'] is not None else "No tasks"
+                
+                print(f"  Team {team_num} ({team_info['lead_name']}): {team_data['assigned_tasks']} tasks -> {team_file}")
+                print(f"    Serial Range: {serial_range_str}")
+                print(f"    Capacity: {team_info['weekly_capacity']}, Used: {team_data['assigned_tasks']}, Remaining: {team_data['remaining_capacity']}")
+                print(f"    Tasks per developer: {tasks_per_dev:.1f}, Days needed: {days_needed}")
+                
+                # Repository distribution
+                repo_counts = team_data['repo_distribution']
+                if not team_data['tasks'].empty:
+                    print(f"    Repositories: {len(repo_counts)} repos")
+                
+                # Add to week distribution report
+                week_distribution['teams'].append({
+                    'team_number': team_num,
+                    'lead_name': team_info['lead_name'],
+                    'num_developers': team_info['num_developers'],
+                    'weekly_capacity': team_info['weekly_capacity'],
+                    'assigned_tasks': team_data['assigned_tasks'],
+                    'remaining_capacity': team_data['remaining_capacity'],
+                    'tasks_per_developer': round(tasks_per_dev, 1),
+                    'days_needed': days_needed,
+                    'repositories': len(repo_counts),
+                    'repo_distribution': repo_counts,
+                    'serial_range': serial_range
+                })
             
-            # Add to week distribution report
-            week_distribution['teams'].append({
-                'team_number': team_num,
-                'lead_name': team_info['lead_name'],
-                'num_developers': team_info['num_developers'],
-                'weekly_capacity': team_info['weekly_capacity'],
-                'assigned_tasks': team_data['assigned_tasks'],
-                'remaining_capacity': team_data['remaining_capacity'],
-                'tasks_per_developer': round(tasks_per_dev, 1),
-                'days_needed': days_needed,
-                'repositories': len(repo_counts),
-                'repo_distribution': dict(repo_counts),
-                'serial_range': serial_range
-            })
-        
-        distribution_report['weekly_distributions'].append(week_distribution)
+            distribution_report['weekly_distributions'].append(week_distribution)
     
     return distribution_report
 
+def generate_distribution_report_json(distribution_report, base_output_dir="task_distribution"):
+    """Save the distribution report as JSON for programmatic consumers"""
+    report_file = Path(base_output_dir) / "distribution_report.json"
+    
+    if orjson is not None:
+        report_file.write_bytes(orjson.dumps(distribution_report, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        report_file.write_text(json.dumps(distribution_report, default=str, indent=2))
+    
+    print(f"Distribution report JSON saved: {report_file}")
+    return report_file
+
+def render_distribution_report_md(distribution_report):
+    """Render the distribution report as a Markdown string"""
+    lines = []
+    add = lines.append
+    
+    add("# Task Distribution Report\n\n")
+    add(f"**Generated on:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    
+    # Overall Summary
+    add("## Overall Summary\n\n")
+    add("| Metric | Value |\n")
+    add("|--------|-------|\n")
+    add(f"| Total Tasks | {distribution_report['total_tasks']} |\n")
+    add(f"| Total Weeks | {distribution_report['total_weeks']} |\n")
+    add(f"| Total Teams | {len(distribution_report['teams'])} |\n\n")
+    
+    # Team Information
+    add("## Team Information\n\n")
+    add("| Team | Lead Name | Developers | Weekly Capacity | Formula |\n")
+    add("|------|-----------|------------|-----------------|----------|\n")
+    
+    total_capacity = 0
+    for team in distribution_report['teams']:
+        formula = f"{team['num_developers']} × 5 × 5"
+        add(f"| {team['team_number']} | {team['lead_name']} | {team['num_developers']} | {team['weekly_capacity']} | {formula} |\n")
+        total_capacity += team['weekly_capacity']
+    
+    add(f"\n**Total Weekly Capacity:** {total_capacity} tasks\n\n")
+    
+    # Weekly Distribution Details
+    add("## Weekly Distribution Details\n\n")
+    
+    for week_dist in distribution_report['weekly_distributions']:
+        add(f"### Week {week_dist['week']}\n\n")
+        add(f"**Total Tasks:** {week_dist['total_tasks']} | ")
+        add(f"**Serial Range:** {week_dist['serial_range']['min']}-{week_dist['serial_range']['max']}\n\n")
+        
+        add("| Team | Lead | Assigned Tasks | Capacity Usage | Tasks/Dev | Days Needed | Serial Range | Repositories |\n")
+        add("|------|------|----------------|----------------|-----------|-------------|--------------|-------------|\n")
+        
+        for team in week_dist['teams']:
+            capacity_usage = f"{(team['assigned_tasks']/team['weekly_capacity']*100):.1f}%" if team['weekly_capacity'] > 0 else "0%"
+            serial_range = f"{team['serial_range']['min']}-{team['serial_range']['max']}" if team['serial_range']['min'] is not None else "None"
+            
+            add(f"| {team['team_number']} | {team['lead_name']} | {team['assigned_tasks']}/{team['weekly_capacity']} | {capacity_usage} | {team['tasks_per_developer']} | {team['days_needed']}/5 | {serial_range} | {team['repositories']} |\n")
+        
+        add("\n")
+        
+        # Repository Distribution for each team (repo_distribution is already sorted by repo name)
+        for team in week_dist['teams']:
+            if team['repo_distribution']:
+                add(f"#### Team {team['team_number']} - {team['lead_name']} Repository Distribution\n\n")
+                add("| Repository | Tasks |\n")
+                add("|------------|-------|\n")
+                lines.extend(f"| {repo} | {count} |\n" for repo, count in team['repo_distribution'].items())
+                add("\n")
+    
+    # Capacity Analysis
+    add("## Capacity Analysis\n\n")
+    add("| Week | Tasks Assigned | Total Capacity | Utilization |\n")
+    add("|------|----------------|----------------|-------------|\n")
+    
+    overall_assigned = 0
+    overall_capacity = 0
+    
+    for week_num, week_dist in enumerate(distribution_report['weekly_distributions'], 1):
+        total_assigned = sum(team['assigned_tasks'] for team in week_dist['teams'])
+        total_capacity = sum(team['weekly_capacity'] for team in week_dist['teams'])
+        utilization = f"{(total_assigned / total_capacity * 100):.1f}%" if total_capacity > 0 else "0%"
+        
+        add(f"| {week_num} | {total_assigned} | {total_capacity} | {utilization} |\n")
+        
+        overall_assigned += total_assigned
+        overall_capacity += total_capacity
+    
+    overall_utilization = f"{(overall_assigned / overall_capacity * 100):.1f}%" if overall_capacity > 0 else "0%"
+    add(f"| **Total** | **{overall_assigned}** | **{overall_capacity}** | **{overall_utilization}** |\n\n")
+    
+    # Project Statistics
+    add("## Project Statistics\n\n")
+    add("### Key Metrics\n\n")
+    add("- **Serial Number Sequence:** Maintained across all teams and weeks\n")
+    add("- **Repository Integrity:** Each repository assigned to single team\n")
+    add("- **Workload Balance:** Distributed based on team capacity\n")
+    add(f"- **Average Utilization:** {overall_utilization}\n")
+    add(f"- **Estimated Completion:** {distribution_report['total_weeks']} weeks\n\n")
+    
+    add("### Distribution Strategy\n\n")
+    add("1. **Capacity-Based:** Tasks distributed according to team size\n")
+    add("2. **Repository Consolidation:** Same repo stays with same team\n")
+    add("3. **Sequential Assignment:** Serial numbers maintained in order\n")
+    add("4. **Balanced Workload:** ~5 tasks per developer per day\n")
+    add("5. **5-Day Work Week:** Planning based on standard work schedule\n\n")
+    
+    return ''.join(lines)
+
 def generate_distribution_report_md(distribution_report, base_output_dir="task_distribution"):
     """Generate a comprehensive distribution report in Markdown format"""
     print("\nGenerating distribution report in Markdown format...")
@@ -250,95 +568,7 @@ def generate_distribution_report_md(distribution_report, base_output_dir="task_d
     report_file = Path(base_output_dir) / "distribution_report.md"
     
     with open(report_file, 'w') as f:
-        f.write("# Task Distribution Report\n\n")
-        f.write(f"**Generated on:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        
-        # Overall Summary
-        f.write("## Overall Summary\n\n")
-        f.write(f"| Metric | Value |\n")
-        f.write(f"|--------|-------|\n")
-        f.write(f"| Total Tasks | {distribution_report['total_tasks']} |\n")
-        f.write(f"| Total Weeks | {distribution_report['total_weeks']} |\n")
-        f.write(f"| Total Teams | {len(distribution_report['teams'])} |\n\n")
-        
-        # Team Information
-        f.write("## Team Information\n\n")
-        f.write("| Team | Lead Name | Developers | Weekly Capacity | Formula |\n")
-        f.write("|------|-----------|------------|-----------------|----------|\n")
-        
-        total_capacity = 0
-        for team in distribution_report['teams']:
-            formula = f"{team['num_developers']} × 5 × 5"
-            f.write(f"| {team['team_number']} | {team['lead_name']} | {team['num_developers']} | {team['weekly_capacity']} | {formula} |\n")
-            total_capacity += team['weekly_capacity']
-        
-        f.write(f"\n**Total Weekly Capacity:** {total_capacity} tasks\n\n")
-        
-        # Weekly Distribution Details
-        f.write("## Weekly Distribution Details\n\n")
-        
-        for week_dist in distribution_report['weekly_distributions']:
-            f.write(f"### Week {week_dist['week']}\n\n")
-            f.write(f"**Total Tasks:** {week_dist['total_tasks']} | ")
-            f.write(f"**Serial Range:** {week_dist['serial_range']['min']}-{week_dist['serial_range']['max']}\n\n")
-            
-            f.write("| Team | Lead | Assigned Tasks | Capacity Usage | Tasks/Dev | Days Needed | Serial Range | Repositories |\n")
-            f.write("|------|------|----------------|----------------|-----------|-------------|--------------|-------------|\n")
-            
-            for team in week_dist['teams']:
-                capacity_usage = f"{(team['assigned_tasks']/team['weekly_capacity']*100):.1f}%" if team['weekly_capacity'] > 0 else "0%"
-                serial_range = f"{team['serial_range']['min']}-{team['serial_range']['max']}" if team['serial_range']['min'] is not None else "None"
-                
-                f.write(f"| {team['team_number']} | {team['lead_name']} | {team['assigned_tasks']}/{team['weekly_capacity']} | {capacity_usage} | {team['tasks_per_developer']} | {team['days_needed']}/5 | {serial_range} | {team['repositories']} |\n")
-            
-            f.write("\n")
-            
-            # Repository Distribution for each team
-            for team in week_dist['teams']:
-                if team['repo_distribution']:
-                    f.write(f"#### Team {team['team_number']} - {team['lead_name']} Repository Distribution\n\n")
-                    f.write("| Repository | Tasks |\n")
-                    f.write("|------------|-------|\n")
-                    for repo, count in sorted(team['repo_distribution'].items()):
-                        f.write(f"| {repo} | {count} |\n")
-                    f.write("\n")
-        
-        # Capacity Analysis
-        f.write("## Capacity Analysis\n\n")
-        f.write("| Week | Tasks Assigned | Total Capacity | Utilization |\n")
-        f.write("|------|----------------|----------------|-------------|\n")
-        
-        overall_assigned = 0
-        overall_capacity = 0
-        
-        for week_num, week_dist in enumerate(distribution_report['weekly_distributions'], 1):
-            total_assigned = sum(team['assigned_tasks'] for team in week_dist['teams'])
-            total_capacity = sum(team['weekly_capacity'] for team in week_dist['teams'])
-            utilization = f"{(total_assigned / total_capacity * 100):.1f}%" if total_capacity > 0 else "0%"
-            
-            f.write(f"| {week_num} | {total_assigned} | {total_capacity} | {utilization} |\n")
-            
-            overall_assigned += total_assigned
-            overall_capacity += total_capacity
-        
-        overall_utilization = f"{(overall_assigned / overall_capacity * 100):.1f}%" if overall_capacity > 0 else "0%"
-        f.write(f"| **Total** | **{overall_assigned}** | **{overall_capacity}** | **{overall_utilization}** |\n\n")
-        
-        # Project Statistics
-        f.write("## Project Statistics\n\n")
-        f.write("### Key Metrics\n\n")
-        f.write(f"- **Serial Number Sequence:** Maintained across all teams and weeks\n")
-        f.write(f"- **Repository Integrity:** Each repository assigned to single team\n")
-        f.write(f"- **Workload Balance:** Distributed based on team capacity\n")
-        f.write(f"- **Average Utilization:** {overall_utilization}\n")
-        f.write(f"- **Estimated Completion:** {distribution_report['total_weeks']} weeks\n\n")
-        
-        f.write("### Distribution Strategy\n\n")
-        f.write("1. **Capacity-Based:** Tasks distributed according to team size\n")
-        f.write("2. **Repository Consolidation:** Same repo stays with same team\n")
-        f.write("3. **Sequential Assignment:** Serial numbers maintained in order\n")
-        f.write("4. **Balanced Workload:** ~5 tasks per developer per day\n")
-        f.write("5. **5-Day Work Week:** Planning based on standard work schedule\n\n")
+        f.write(render_distribution_report_md(distribution_report))
     
     print(f"Distribution report saved: {report_file}")
     return report_file
@@ -379,7 +609,7 @@ def main():
         
         # Save the sorted CSV with serial numbers
         sorted_csv_file = jsonl_file.replace('.jsonl', '_sorted_with_serial.csv')
-        sorted_df.to_csv(sorted_csv_file, index=False)
+        save_dataframe_csv(sorted_df, sorted_csv_file)
         print(f"Sorted CSV with serial numbers saved: {sorted_csv_file}")
         
         # Step 3: Get team information
@@ -391,8 +621,9 @@ def main():
         # Step 5: Create folder structure and team distribution
         distribution_report = create_folder_structure_and_save(weekly_batches, teams_info)
         
-        # Step 6: Generate comprehensive markdown report
+        # Step 6: Generate comprehensive markdown report and its JSON counterpart
         report_file = generate_distribution_report_md(distribution_report)
+        report_json_file = generate_distribution_report_json(distribution_report)
         
         print(f"\n=== Distribution Complete ===")
         print(f"Total tasks processed: {len(df)}")
@@ -402,6 +633,7 @@ def main():
         print(f"Complete CSV file: {csv_file}")
         print(f"Sorted CSV with serials: {sorted_csv_file}")
         print(f"Distribution report: {report_file}")
+        print(f"Distribution report JSON: {report_json_file}")
         
         # Summary statistics
         total_capacity = sum(team['weekly_capacity'] for team in teams_info)